@@ -154,9 +154,9 @@ function truncateToContextLimit(
 	const availableTokens = maxTokens - systemTokens;
 
 	const conversationMessages = messages.slice(1);
-	const totalConversationTokens = conversationMessages.reduce(
-		(sum, m) => sum + estimateTokens(m.content), 0
-	);
+	// Estimate each message once; the kept-half total below reuses these counts
+	const messageTokens = conversationMessages.map(m => estimateTokens(m.content));
+	const totalConversationTokens = messageTokens.reduce((sum, t) => sum + t, 0);
 
 	if (totalConversationTokens <= availableTokens) {
 		return messages;
@@ -165,7 +165,7 @@ function truncateToContextLimit(
 	// Drop first half of conversation messages to maximize KV cache hits
 	const halfIndex = Math.ceil(conversationMessages.length / 2);
 	const keptMessages = conversationMessages.slice(halfIndex);
-	const keptTokens = keptMessages.reduce((sum, m) => sum + estimateTokens(m.content), 0);
+	const keptTokens = messageTokens.slice(halfIndex).reduce((sum, t) => sum + t, 0);
 
 	console.log(`[crowd-pilot] Dropped first ${halfIndex} messages (${systemTokens + totalConversationTokens} -> ${systemTokens + keptTokens} tokens)`);
 	return [messages[0], ...keptMessages];
@@ -653,8 +653,8 @@ async function callSGLangChat(): Promise<void> {
 	requestBody.chat_template_kwargs = {
 		enable_thinking: false
 	};
-	const postData = JSON.stringify(requestBody);
-	headers['Content-Length'] = Buffer.byteLength(postData);
+	const postData = Buffer.from(JSON.stringify(requestBody), 'utf8');
+	headers['Content-Length'] = postData.length;
 
 	const options = {
 		hostname: cfg.hostname,
@@ -668,13 +668,13 @@ async function callSGLangChat(): Promise<void> {
 	try {
 		const json = await new Promise<any>((resolve, reject) => {
 			const req = http.request(options, (res: http.IncomingMessage) => {
-				let data = '';
+				const chunks: Buffer[] = [];
 				res.on('data', (chunk: Buffer) => {
-					data += chunk.toString();
+					chunks.push(chunk);
 				});
 				res.on('end', () => {
 					try {
-						resolve(JSON.parse(data));
+						resolve(JSON.parse(Buffer.concat(chunks).toString('utf8')));
 					} catch (err) {
 						reject(new Error(`Failed to parse response: ${err instanceof Error ? err.message : String(err)}`));
 					}
@@ -733,8 +733,9 @@ async function requestModelActions(editor: vscode.TextEditor, signal?: AbortSign
 		enable_thinking: false
 	};
 
-	const postData = JSON.stringify(requestBody);
-	headers['Content-Length'] = Buffer.byteLength(postData);
+	// Encode once: the byte length and the request write both use the same Buffer
+	const postData = Buffer.from(JSON.stringify(requestBody), 'utf8');
+	headers['Content-Length'] = postData.length;
 
 	const options: any = {
 		hostname: cfg.hostname,
@@ -749,11 +750,13 @@ async function requestModelActions(editor: vscode.TextEditor, signal?: AbortSign
 
 	const json = await new Promise<any>((resolve, reject) => {
 		const req = http.request(options, (res: http.IncomingMessage) => {
-			let data = '';
-			res.on('data', (chunk: Buffer) => { data += chunk.toString(); });
+			// Keep raw chunks and decode once at the end: this avoids re-copying the
+			// growing string per chunk and cannot split a multi-byte UTF-8 character.
+			const chunks: Buffer[] = [];
+			res.on('data', (chunk: Buffer) => { chunks.push(chunk); });
 			res.on('end', () => {
 				try {
-					resolve(JSON.parse(data));
+					resolve(JSON.parse(Buffer.concat(chunks).toString('utf8')));
 				} catch (err) {
 					reject(new Error(`Failed to parse response: ${err instanceof Error ? err.message : String(err)}`));
 				}
@@ -857,6 +860,30 @@ function sanitizeCommandForDisplay(cmd: string): string {
 		.trim();
 }
 
+/**
+ * Undo the shell quoting and escape sequences the serializer applies to sed payloads.
+ */
+function unescapeSedPayload(payload: string): string {
+	payload = payload.replace(/'\"'\"'/g, "'");
+	// Most payloads carry no escapes; skip the escape passes entirely in that case
+	if (!payload.includes('\\')) {
+		return payload;
+	}
+	// Convert escape sequences to actual characters
+	return payload.replace(/\\n/g, '\n').replace(/\\t/g, '\t').replace(/\\'/g, "'").replace(/\\\\/g, '\\');
+}
+
+// Command patterns used by parseAction, compiled once at module load rather than
+// re-created on every model response.
+const COMMAND_CHAIN_SEPARATOR = /&&|\|\|/;
+const SED_COMMAND_PATTERN = /sed\s+(?:-[A-Za-z]+\s+)*-i\s+(?:-[A-Za-z]+\s+)*'([\s\S]*?)'\s+([^\s&|]+)\s*$/;
+const SED_DELETE_PATTERN = /^(\d+),(\d+)d$/;
+const SED_REPLACE_PATTERN = /^(\d+),(\d+)c\\\n([\s\S]*)$/;
+const SED_INSERT_PATTERN = /^(\d+)i\\\n([\s\S]*)$/;
+const SED_APPEND_PATTERN = /^\$a\\\n([\s\S]*)$/;
+const CAT_FILE_PATTERN = /^cat\s+-n\s+([^\s|]+)\s*$/;
+const CAT_VIEWPORT_PATTERN = /^cat\s+-n\s+([^\s|]+)\s*\|\s*sed\s+-n\s+'(\d+),(\d+)p'\s*$/;
+
 /**
  * Parse a sed-based edit command of the form emitted by the NeMo serializer into a VS Code edit action.
  *
@@ -870,14 +897,18 @@ function sanitizeCommandForDisplay(cmd: string): string {
  */
 function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Action | undefined {
 	// Only consider the first command before && / ||, since cat -n etc. are for viewport only.
-	const main = command.split(/&&|\|\|/)[0]?.trim() ?? '';
+	const main = command.split(COMMAND_CHAIN_SEPARATOR)[0]?.trim() ?? '';
 	if (!main) {
 		return undefined;
 	}
+	// Cheap reject for plain terminal commands before running the sed regex
+	if (!main.includes('sed')) {
+		return undefined;
+	}
 
 	// Match: sed with optional flags like -E, -n, -r, followed by -i, then script and file
 	// Handles: sed -i '...' file, sed -E -i '...' file, sed -i -E '...' file, etc.
-	const sedMatch = main.match(/sed\s+(?:-[A-Za-z]+\s+)*-i\s+(?:-[A-Za-z]+\s+)*'([\s\S]*?)'\s+([^\s&|]+)\s*$/);
+	const sedMatch = main.match(SED_COMMAND_PATTERN);
 	if (!sedMatch) {
 		return undefined;
 	}
@@ -889,7 +920,7 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
 	}
 
 	// Delete: "START,ENDd"
-	const deleteMatch = script.match(/^(\d+),(\d+)d$/);
+	const deleteMatch = script.match(SED_DELETE_PATTERN);
 	if (deleteMatch) {
 		const startLine1 = Number(deleteMatch[1]);
 		const endLine1 = Number(deleteMatch[2]);
@@ -915,7 +946,7 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
 	}
 
 	// Replace: "START,ENDc\newline<payload...>"
-	const replaceMatch = script.match(/^(\d+),(\d+)c\\\n([\s\S]*)$/);
+	const replaceMatch = script.match(SED_REPLACE_PATTERN);
 	if (replaceMatch) {
 		const startLine1 = Number(replaceMatch[1]);
 		const endLine1 = Number(replaceMatch[2]);
@@ -923,9 +954,7 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
 		if (!Number.isFinite(startLine1) || !Number.isFinite(endLine1)) {
 			return undefined;
 		}
-		payload = payload.replace(/'\"'\"'/g, "'");
-		// Convert escape sequences to actual characters
-		payload = payload.replace(/\\n/g, '\n').replace(/\\t/g, '\t').replace(/\\'/g, "'").replace(/\\\\/g, '\\');
+		payload = unescapeSedPayload(payload);
 		const startLine0 = Math.max(0, startLine1 - 1);
 		const endLine0 = Math.max(0, endLine1 - 1);
 		const startPos: [number, number] = [startLine0, 0];
@@ -945,16 +974,14 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
 		};
 	}
 
-	const insertMatch = script.match(/^(\d+)i\\\n([\s\S]*)$/);
+	const insertMatch = script.match(SED_INSERT_PATTERN);
 	if (insertMatch) {
 		const line1 = Number(insertMatch[1]);
 		let payload = insertMatch[2] ?? '';
 		if (!Number.isFinite(line1)) {
 			return undefined;
 		}
-		payload = payload.replace(/'\"'\"'/g, "'");
-		// Convert escape sequences to actual characters
-		payload = payload.replace(/\\n/g, '\n').replace(/\\t/g, '\t').replace(/\\'/g, "'").replace(/\\\\/g, '\\');
+		payload = unescapeSedPayload(payload);
 		const insertLine0 = Math.max(0, line1 - 1);
 		const position: [number, number] = [insertLine0, 0];
 		const text = payload.endsWith('\n') ? payload : payload + '\n';
@@ -965,12 +992,9 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
 		};
 	}
 
-	const appendMatch = script.match(/^\$a\\\n([\s\S]*)$/);
+	const appendMatch = script.match(SED_APPEND_PATTERN);
 	if (appendMatch) {
-		let payload = appendMatch[1] ?? '';
-		payload = payload.replace(/'\"'\"'/g, "'");
-		// Convert escape sequences to actual characters
-		payload = payload.replace(/\\n/g, '\n').replace(/\\t/g, '\t').replace(/\\'/g, "'").replace(/\\\\/g, '\\');
+		const payload = unescapeSedPayload(appendMatch[1] ?? '');
 		const insertLine0 = doc.lineCount;
 		const position: [number, number] = [insertLine0, 0];
 		const needsLeadingNewline = doc.lineCount > 0;
@@ -994,13 +1018,17 @@ function parseEditFromSedCommand(command: string, doc: vscode.TextDocument): Act
  * selection and viewport events are serialized in serialization_utils.py.
  */
 function parseViewportFromCatCommand(command: string, doc: vscode.TextDocument): Action | undefined {
-	const main = command.split(/&&|\|\|/)[0]?.trim() ?? '';
+	const main = command.split(COMMAND_CHAIN_SEPARATOR)[0]?.trim() ?? '';
 	if (!main) {
 		return undefined;
 	}
+	// Both patterns below are anchored at 'cat'; reject anything else without running them
+	if (!main.startsWith('cat')) {
+		return undefined;
+	}
 
 	// Simple file-open: cat -n <file>
-	const simpleCatMatch = main.match(/^cat\s+-n\s+([^\s|]+)\s*$/);
+	const simpleCatMatch = main.match(CAT_FILE_PATTERN);
 	if (simpleCatMatch) {
 		const targetFile = simpleCatMatch[1] ?? '';
 		if (targetFile !== doc.uri.fsPath) {
@@ -1011,7 +1039,7 @@ function parseViewportFromCatCommand(command: string, doc: vscode.TextDocument):
 	}
 
 	// Viewport slice: cat -n <file> | sed -n 'START,ENDp'
-	const viewportMatch = main.match(/^cat\s+-n\s+([^\s|]+)\s*\|\s*sed\s+-n\s+'(\d+),(\d+)p'\s*$/);
+	const viewportMatch = main.match(CAT_VIEWPORT_PATTERN);
 	if (!viewportMatch) {
 		return undefined;
 	}
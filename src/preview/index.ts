@@ -4,7 +4,7 @@ import { DecorationPool, COLORS } from './decorations';
 import { CrowdPilotInlineProvider } from './inlineProvider';
 import { MetaActionHoverProvider } from './hoverProvider';
 import { showPendingActionQuickPick, QuickPickResult } from './quickPick';
-import { computeDeletionRanges, hasInsertions, analyzeCoherentReplacement, analyzePureInsertion } from '../utils/diff';
+import { diffChars, computeDeletionRanges, hasInsertions, analyzeCoherentReplacement, analyzePureInsertion } from '../utils/diff';
 
 // Re-export types
 export { Action, toVscodeRange, toVscodePosition, truncate } from './types';
@@ -196,15 +196,17 @@ export class PreviewManager {
 
         const range = toVscodeRange(action.range);
         const oldText = editor.document.getText(range);
+        // The LCS diff is quadratic, so compute it once and share it across all checks below
+        const diffs = diffChars(oldText, action.text);
         
         // Case 1: Check for pure insertion first (no deletions)
-        const pureInsertion = analyzePureInsertion(editor.document, range, action.text);
+        const pureInsertion = analyzePureInsertion(editor.document, range, action.text, diffs);
         if (pureInsertion.isPureInsertion && pureInsertion.insertionPosition && pureInsertion.insertionText) {
             // Pure insertion: show only the new text inline in green (no red)
             this.showInlineInsertion(editor, pureInsertion.insertionPosition, pureInsertion.insertionText);
         } else {
             // Case 2: Has deletions - show red strikethrough
-            const deletionRanges = computeDeletionRanges(editor.document, range, action.text);
+            const deletionRanges = computeDeletionRanges(editor.document, range, action.text, diffs);
             
             if (deletionRanges.length > 0) {
                 const decorationOptions: vscode.DecorationOptions[] = deletionRanges.map(r => ({
@@ -218,9 +220,9 @@ export class PreviewManager {
             
             // Green highlight on text being added - only if there's actual new content
             // Don't show if it's purely a deletion (new text is subset of old text)
-            if (hasInsertions(oldText, action.text)) {
+            if (hasInsertions(oldText, action.text, diffs)) {
                 // Check if this is a coherent single-substring replacement
-                const coherent = analyzeCoherentReplacement(editor.document, range, action.text);
+                const coherent = analyzeCoherentReplacement(editor.document, range, action.text, diffs);
                 
                 if (coherent.isCoherent && coherent.deletionRange && coherent.insertionText) {
                     // Coherent: show green text inline right after the red deletion
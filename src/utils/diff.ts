@@ -5,7 +5,7 @@ import * as vscode from 'vscode';
 /**
  * Represents a segment of a diff result.
  */
-interface DiffSegment {
+export interface DiffSegment {
     type: 'equal' | 'insert' | 'delete';
     value: string;
 }
@@ -26,42 +26,42 @@ export function diffChars(oldText: string, newText: string): DiffSegment[] {
     let lcsIndex = 0;
     
     while (oldIndex < oldText.length || newIndex < newText.length) {
+        // Each run is contiguous in its source string, so scan for its end and
+        // take a single slice instead of growing a string one character at a time.
+
         // Handle deletions (chars in old but not in LCS)
-        let deletedChars = '';
+        const deleteStart = oldIndex;
         while (oldIndex < oldText.length && 
                (lcsIndex >= lcs.length || oldText[oldIndex] !== lcs[lcsIndex])) {
-            deletedChars += oldText[oldIndex];
             oldIndex++;
         }
-        if (deletedChars) {
-            segments.push({ type: 'delete', value: deletedChars });
+        if (oldIndex > deleteStart) {
+            segments.push({ type: 'delete', value: oldText.slice(deleteStart, oldIndex) });
         }
         
         // Handle insertions (chars in new but not in LCS)
-        let insertedChars = '';
+        const insertStart = newIndex;
         while (newIndex < newText.length && 
                (lcsIndex >= lcs.length || newText[newIndex] !== lcs[lcsIndex])) {
-            insertedChars += newText[newIndex];
             newIndex++;
         }
-        if (insertedChars) {
-            segments.push({ type: 'insert', value: insertedChars });
+        if (newIndex > insertStart) {
+            segments.push({ type: 'insert', value: newText.slice(insertStart, newIndex) });
         }
         
         // Handle equal chars (from LCS)
-        let equalChars = '';
+        const equalStart = lcsIndex;
         while (lcsIndex < lcs.length && 
                oldIndex < oldText.length && 
                newIndex < newText.length &&
                oldText[oldIndex] === lcs[lcsIndex] && 
                newText[newIndex] === lcs[lcsIndex]) {
-            equalChars += lcs[lcsIndex];
             oldIndex++;
             newIndex++;
             lcsIndex++;
         }
-        if (equalChars) {
-            segments.push({ type: 'equal', value: equalChars });
+        if (lcsIndex > equalStart) {
+            segments.push({ type: 'equal', value: lcs.slice(equalStart, lcsIndex) });
         }
     }
     
@@ -75,51 +75,55 @@ function longestCommonSubsequence(str1: string, str2: string): string {
     const m = str1.length;
     const n = str2.length;
     
-    // Create DP table
-    const dp: number[][] = Array(m + 1).fill(null).map(() => Array(n + 1).fill(0));
+    // Create DP table as a single flat row-major buffer (row stride n + 1) instead
+    // of an array of per-row arrays; zero-initialized and contiguous in memory
+    const w = n + 1;
+    const dp = new Uint32Array((m + 1) * w);
     
     // Fill DP table
     for (let i = 1; i <= m; i++) {
+        const row = i * w;
+        const prevRow = row - w;
         for (let j = 1; j <= n; j++) {
             if (str1[i - 1] === str2[j - 1]) {
-                dp[i][j] = dp[i - 1][j - 1] + 1;
+                dp[row + j] = dp[prevRow + j - 1] + 1;
             } else {
-                dp[i][j] = Math.max(dp[i - 1][j], dp[i][j - 1]);
+                dp[row + j] = Math.max(dp[prevRow + j], dp[row + j - 1]);
             }
         }
     }
     
-    // Backtrack to find LCS
-    let lcs = '';
+    // Backtrack to find LCS. Characters come out in reverse order; collect them
+    // and join once rather than prepending, which would copy the prefix every step.
+    const reversed: string[] = [];
     let i = m;
     let j = n;
     while (i > 0 && j > 0) {
         if (str1[i - 1] === str2[j - 1]) {
-            lcs = str1[i - 1] + lcs;
+            reversed.push(str1[i - 1]);
             i--;
             j--;
-        } else if (dp[i - 1][j] > dp[i][j - 1]) {
+        } else if (dp[(i - 1) * w + j] > dp[i * w + j - 1]) {
             i--;
         } else {
             j--;
         }
     }
     
-    return lcs;
+    return reversed.reverse().join('');
 }
 
 /**
  * Compute VS Code ranges for characters that will be deleted in a replacement.
  * These are characters in the old text that don't appear in the new text.
+ * Pass `diffs` to reuse a diff already computed for the same range and text.
  */
 export function computeDeletionRanges(
     doc: vscode.TextDocument,
     range: vscode.Range,
-    newText: string
+    newText: string,
+    diffs: DiffSegment[] = diffChars(doc.getText(range), newText)
 ): vscode.Range[] {
-    const oldText = doc.getText(range);
-    const diffs = diffChars(oldText, newText);
-    
     const deletions: vscode.Range[] = [];
     let offset = doc.offsetAt(range.start);
     
@@ -156,12 +160,12 @@ export function hasSignificantDiff(oldText: string, newText: string): boolean {
  * Check if the diff between old and new text contains any insertions.
  * Returns true if new text has content that doesn't exist in old text.
  */
-export function hasInsertions(oldText: string, newText: string): boolean {
+export function hasInsertions(oldText: string, newText: string, diffs?: DiffSegment[]): boolean {
     if (!newText || newText.length === 0) {
         return false;
     }
     
-    const diffs = diffChars(oldText, newText);
+    diffs ??= diffChars(oldText, newText);
     return diffs.some(segment => segment.type === 'insert' && segment.value.trim().length > 0);
 }
 
@@ -193,11 +197,9 @@ export interface PureInsertion {
 export function analyzeCoherentReplacement(
     doc: vscode.TextDocument,
     range: vscode.Range,
-    newText: string
+    newText: string,
+    diffs: DiffSegment[] = diffChars(doc.getText(range), newText)
 ): CoherentReplacement {
-    const oldText = doc.getText(range);
-    const diffs = diffChars(oldText, newText);
-    
     // Count change regions (consecutive delete/insert blocks)
     let changeRegions = 0;
     let lastWasChange = false;
@@ -270,11 +272,9 @@ export function analyzeCoherentReplacement(
 export function analyzePureInsertion(
     doc: vscode.TextDocument,
     range: vscode.Range,
-    newText: string
+    newText: string,
+    diffs: DiffSegment[] = diffChars(doc.getText(range), newText)
 ): PureInsertion {
-    const oldText = doc.getText(range);
-    const diffs = diffChars(oldText, newText);
-    
     // Check if there are any deletions - if so, not a pure insertion
     const hasDeletions = diffs.some(segment => segment.type === 'delete');
     if (hasDeletions) {